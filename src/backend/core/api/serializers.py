@@ -118,8 +118,12 @@ class RoomSerializer(serializers.ModelSerializer):
         is_admin = models.RoleChoices.check_administrator_role(role)
 
         if role is not None:
+            if "accesses" in getattr(instance, "_prefetched_objects_cache", {}):
+                accesses = instance.accesses.all()
+            else:
+                accesses = instance.accesses.select_related("resource", "user").all()
             access_serializer = NestedResourceAccessSerializer(
-                instance.accesses.select_related("resource", "user").all(),
+                accesses,
                 context=self.context,
                 many=True,
             )
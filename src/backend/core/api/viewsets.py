@@ -1,11 +1,16 @@
 """API endpoints"""
 
+import functools
+import re
 import uuid
 from logging import getLogger
 
 from django.conf import settings
-from django.db.models import Q
-from django.http import Http404
+from django.core.cache import cache
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Prefetch, Q
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils.text import slugify
 
@@ -20,14 +25,13 @@ from rest_framework import (
     status as drf_status,
 )
 
-from core import models, utils
+from core import models, tasks, utils
 from core.recording.event.authentication import StorageEventAuthentication
 from core.recording.event.exceptions import (
     InvalidBucketError,
     InvalidFileTypeError,
     ParsingEventDataError,
 )
-from core.recording.event.notification import notification_service
 from core.recording.event.parsers import get_parser
 from core.recording.worker.exceptions import (
     RecordingStartError,
@@ -55,6 +59,46 @@ from . import permissions, serializers
 
 logger = getLogger(__name__)
 
+# Cheap pre-check before attempting to parse a room lookup key as a UUID,
+# to skip the costly exception path for slugs
+UUID_RE = re.compile(r"^[0-9a-f-]{32,36}$", re.IGNORECASE)
+
+# Lifespan, in seconds, of the tokens cached for unregistered rooms
+UNREGISTERED_ROOM_TOKEN_CACHE_TIMEOUT = 30
+
+# Precomputed success body for the LiveKit webhook endpoint
+LIVEKIT_WEBHOOK_OK_BODY = b'{"status": "success"}'
+
+
+@functools.lru_cache(maxsize=8)
+def get_worker_service_mediator(mode):
+    """Return the mediator for the worker service handling the given mode.
+
+    The mediator and its worker service are stateless, so one instance per
+    recording mode is built lazily and reused across requests instead of
+    being reconstructed for each recording action.
+    """
+    return WorkerServiceMediator(worker_service=get_worker_service(mode=mode))
+
+
+def get_unregistered_room_token(room, user, username):
+    """Generate a LiveKit token for an unregistered room, with a short-lived cache.
+
+    Anonymous users are never served a cached token: each of them must receive
+    their own unique LiveKit identity. For authenticated users, whose identity
+    is stable, bursts of retrievals of the same room reuse the token instead of
+    signing a new one for each request.
+    """
+    if user.is_anonymous:
+        return utils.generate_token(room=room, user=user, username=username)
+
+    cache_key = f"unregistered-room-token_{user.id!s}_{room}_{username or ''}"
+    token = cache.get(cache_key)
+    if token is None:
+        token = utils.generate_token(room=room, user=user, username=username)
+        cache.set(cache_key, token, UNREGISTERED_ROOM_TOKEN_CACHE_TIMEOUT)
+    return token
+
 
 class NestedGenericViewSet(viewsets.GenericViewSet):
     """
@@ -67,45 +111,55 @@ class NestedGenericViewSet(viewsets.GenericViewSet):
     lookup_fields: list[str] = ["pk"]
     lookup_url_kwargs: list[str] = []
 
-    def __getattribute__(self, item):
-        """
-        This method is overridden to allow to get the last lookup field or lookup url kwarg
-        when accessing the `lookup_field` or `lookup_url_kwarg` attribute. This is useful
-        to keep compatibility with all methods used by the parent class `GenericViewSet`.
-        """
-        if item in ["lookup_field", "lookup_url_kwarg"]:
-            return getattr(self, item + "s", [None])[-1]
+    # Pairs of (url kwarg, lookup field) used for the nested lookup, precomputed
+    # for each subclass. The last lookup field is excluded as it corresponds to
+    # the object pk, it is used within get_object method.
+    _nested_lookup_pairs: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the nested lookup pairs once per subclass."""
+        super().__init_subclass__(**kwargs)
+        lookup_url_kwargs = (
+            cls.lookup_url_kwargs[:-1]
+            if cls.lookup_url_kwargs
+            else cls.lookup_fields[:-1]
+        )
+        cls._nested_lookup_pairs = tuple(
+            zip(lookup_url_kwargs, cls.lookup_fields, strict=False)
+        )
 
-        return super().__getattribute__(item)
+    @property
+    def lookup_field(self):
+        """Expose the last lookup field to keep compatibility with all methods
+        used by the parent class `GenericViewSet`."""
+        return (self.lookup_fields or [None])[-1]
+
+    @property
+    def lookup_url_kwarg(self):
+        """Expose the last lookup url kwarg to keep compatibility with all methods
+        used by the parent class `GenericViewSet`."""
+        return (self.lookup_url_kwargs or [None])[-1]
 
     def get_queryset(self):
         """
         Get the list of items for this view.
 
-        `lookup_fields` attribute is enumerated here to perform the nested lookup.
+        The precomputed `_nested_lookup_pairs` are enumerated here to perform
+        the nested lookup.
         """
         queryset = super().get_queryset()
 
-        # The last lookup field is removed to perform the nested lookup as it corresponds
-        # to the object pk, it is used within get_object method.
-        lookup_url_kwargs = (
-            self.lookup_url_kwargs[:-1]
-            if self.lookup_url_kwargs
-            else self.lookup_fields[:-1]
-        )
-
-        filter_kwargs = {}
-        for index, lookup_url_kwarg in enumerate(lookup_url_kwargs):
-            if lookup_url_kwarg not in self.kwargs:
-                raise KeyError(
-                    f"Expected view {self.__class__.__name__} to be called with a URL "
-                    f'keyword argument named "{lookup_url_kwarg}". Fix your URL conf, or '
-                    "set the `.lookup_fields` attribute on the view correctly."
-                )
-
-            filter_kwargs.update(
-                {self.lookup_fields[index]: self.kwargs[lookup_url_kwarg]}
-            )
+        try:
+            filter_kwargs = {
+                lookup_field: self.kwargs[lookup_url_kwarg]
+                for lookup_url_kwarg, lookup_field in self._nested_lookup_pairs
+            }
+        except KeyError as e:
+            raise KeyError(
+                f"Expected view {self.__class__.__name__} to be called with a URL "
+                f'keyword argument named "{e.args[0]}". Fix your URL conf, or '
+                "set the `.lookup_fields` attribute on the view correctly."
+            ) from e
 
         return queryset.filter(**filter_kwargs)
 
@@ -135,6 +189,49 @@ class Pagination(pagination.PageNumberPagination):
     max_page_size = 100
     page_size_query_param = "page_size"
 
+    def paginate_queryset(self, queryset, request, view=None):
+        """Serve the first page from a single page-sized probe query.
+
+        One extra row is fetched to detect whether the result set overflows the
+        page: if it does not, the total is simply the number of rows fetched
+        and the COUNT query is skipped; if it does, the fetched rows still
+        serve as the page and only the COUNT is issued on top.
+        """
+        page_size = self.get_page_size(request)
+        if not page_size or request.query_params.get(self.page_query_param, "1") != "1":
+            return super().paginate_queryset(queryset, request, view)
+
+        results = list(queryset[: page_size + 1])
+        paginator = DjangoPaginator(results, page_size)
+        if len(results) <= page_size:
+            # "count" is a cached property, assigning it skips the SQL COUNT
+            paginator.count = len(results)
+        else:
+            paginator.count = queryset.count()
+
+        # pylint: disable=attribute-defined-outside-init
+        # Same attributes as the parent implementation, just set here instead
+        self.request = request
+        self.page = paginator.page(1)
+        return list(self.page)
+
+
+class RecordingCursorPagination(pagination.CursorPagination):
+    """Cursor pagination for recordings, sorted by creation date.
+
+    Keyset pagination keeps the cost of a page constant regardless of its
+    depth, where page numbers degrade into ever larger `OFFSET` scans. It
+    also removes the `COUNT` query entirely. The id tie-breaker makes the
+    ordering total, which cursors require to be stable.
+    """
+
+    # Pages are intentionally larger than the global PAGE_SIZE of 20: cursor
+    # pages are cheap and recordings are lightweight rows
+    ordering = ("-created_at", "-id")
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
 
 class UserViewSet(
     mixins.UpdateModelMixin, viewsets.GenericViewSet, mixins.ListModelMixin
@@ -203,19 +300,59 @@ class RoomViewSet(
     API endpoints to access and perform actions on rooms.
     """
 
+    pagination_class = Pagination
     permission_classes = [permissions.RoomPermissions]
     queryset = models.Room.objects.all()
     serializer_class = serializers.RoomSerializer
 
+    def get_queryset(self):
+        """Prefetch the relations rendered by the serializer when listing rooms.
+
+        The serializer walks each room's accesses (and their users) to compute
+        roles and serialize nested accesses, so without prefetching, each room
+        listed would trigger extra queries.
+        """
+        queryset = super().get_queryset()
+
+        if self.action == "list":
+            queryset = queryset.only(
+                "id", "name", "slug", "configuration", "access_level"
+            ).prefetch_related(
+                Prefetch(
+                    "accesses",
+                    queryset=models.ResourceAccess.objects.select_related(
+                        "user", "resource"
+                    ),
+                )
+            )
+
+        return queryset
+
+    @functools.cached_property
+    def _resolved_slug(self):
+        """Slugified lookup key, computed once per request.
+
+        A viewset instance only serves one request so the value can safely be
+        cached on the instance; it is shared between `get_object` and the
+        unregistered-room fallback in `retrieve`.
+        """
+        return slugify(self.kwargs["pk"])
+
     def get_object(self):
-        """Allow getting a room by its slug."""
-        try:
-            uuid.UUID(self.kwargs["pk"])
-            filter_kwargs = {"pk": self.kwargs["pk"]}
-        except ValueError:
-            filter_kwargs = {"slug": slugify(self.kwargs["pk"])}
+        """Allow getting a room by its id or by its slug, in a single query.
+
+        Room slugs are guaranteed not to look like UUIDs so both lookups
+        cannot overlap.
+        """
+        key = self.kwargs["pk"]
+        query = Q(slug=self._resolved_slug)
+        if UUID_RE.match(key):
+            try:
+                query |= Q(pk=uuid.UUID(key))
+            except ValueError:
+                pass
         queryset = self.filter_queryset(self.get_queryset())
-        obj = get_object_or_404(queryset, **filter_kwargs)
+        obj = get_object_or_404(queryset, query)
         # May raise a permission denied
         self.check_object_permissions(self.request, obj)
         return obj
@@ -230,16 +367,14 @@ class RoomViewSet(
         except Http404:
             if not settings.ALLOW_UNREGISTERED_ROOMS:
                 raise
-            slug = slugify(self.kwargs["pk"])
+            slug = self._resolved_slug
             username = request.query_params.get("username", None)
             data = {
                 "id": None,
                 "livekit": {
                     "url": settings.LIVEKIT_CONFIGURATION["url"],
                     "room": slug,
-                    "token": utils.generate_token(
-                        room=slug, user=request.user, username=username
-                    ),
+                    "token": get_unregistered_room_token(slug, request.user, username),
                 },
             }
         else:
@@ -251,12 +386,20 @@ class RoomViewSet(
         """Limit listed rooms to the ones related to the authenticated user."""
         user = self.request.user
 
-        if user.is_authenticated:
-            queryset = (
-                self.filter_queryset(self.get_queryset()).filter(users=user).distinct()
+        if not user.is_authenticated:
+            # Constant empty page: skips the paginator and serializer machinery
+            return drf_response.Response(
+                {"count": 0, "next": None, "previous": None, "results": []}
             )
-        else:
-            queryset = self.get_queryset().none()
+
+        # An EXISTS subquery on the accesses avoids the join + DISTINCT a
+        # filter on the many-to-many relation would require
+        user_accesses = models.ResourceAccess.objects.filter(
+            resource=OuterRef("pk"), user=user
+        )
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            Exists(user_accesses)
+        )
 
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -267,13 +410,18 @@ class RoomViewSet(
         return drf_response.Response(serializer.data)
 
     def perform_create(self, serializer):
-        """Set the current user as owner of the newly created room."""
-        room = serializer.save()
-        models.ResourceAccess.objects.create(
-            resource=room,
-            user=self.request.user,
-            role=models.RoleChoices.OWNER,
-        )
+        """Set the current user as owner of the newly created room.
+
+        The room and its owner access are written in a single transaction so
+        a failure cannot leave an orphan room behind.
+        """
+        with transaction.atomic():
+            room = serializer.save()
+            models.ResourceAccess.objects.create(
+                resource=room,
+                user=self.request.user,
+                role=models.RoleChoices.OWNER,
+            )
 
         if callback_id := self.request.data.get("callback_id"):
             RoomCreation().persist_callback_state(callback_id, room)
@@ -300,15 +448,18 @@ class RoomViewSet(
         mode = serializer.validated_data["mode"]
         room = self.get_object()
 
-        # May raise exception if an active or initiated recording already exist for the room
-        recording = models.Recording.objects.create(room=room, mode=mode)
+        with transaction.atomic():
+            # May raise exception if an active or initiated recording already exist
+            # for the room
+            recording = models.Recording.objects.create(room=room, mode=mode)
 
-        models.RecordingAccess.objects.create(
-            user=self.request.user, role=models.RoleChoices.OWNER, recording=recording
-        )
+            models.RecordingAccess.objects.create(
+                user=self.request.user,
+                role=models.RoleChoices.OWNER,
+                recording=recording,
+            )
 
-        worker_service = get_worker_service(mode=recording.mode)
-        worker_manager = WorkerServiceMediator(worker_service=worker_service)
+        worker_manager = get_worker_service_mediator(recording.mode)
 
         try:
             worker_manager.start(recording)
@@ -337,25 +488,28 @@ class RoomViewSet(
 
         room = self.get_object()
 
-        try:
-            recording = models.Recording.objects.get(
-                room=room, status=models.RecordingStatusChoices.ACTIVE
-            )
-        except models.Recording.DoesNotExist as e:
-            raise drf_exceptions.NotFound(
-                "No active recording found for this room."
-            ) from e
-
-        worker_service = get_worker_service(mode=recording.mode)
-        worker_manager = WorkerServiceMediator(worker_service=worker_service)
-
-        try:
-            worker_manager.stop(recording)
-        except RecordingStopError:
-            return drf_response.Response(
-                {"error": f"Recording failed to stop for room {room.slug}"},
-                status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        with transaction.atomic():
+            try:
+                # Lock the row so overlapping stop requests are serialized: with
+                # "skip_locked", a concurrent request simply no longer sees an
+                # active recording and gets a 404
+                recording = models.Recording.objects.select_for_update(
+                    skip_locked=True
+                ).get(room=room, status=models.RecordingStatusChoices.ACTIVE)
+            except models.Recording.DoesNotExist as e:
+                raise drf_exceptions.NotFound(
+                    "No active recording found for this room."
+                ) from e
+
+            worker_manager = get_worker_service_mediator(recording.mode)
+
+            try:
+                worker_manager.stop(recording)
+            except RecordingStopError:
+                return drf_response.Response(
+                    {"error": f"Recording failed to stop for room {room.slug}"},
+                    status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR,
+                )
 
         return drf_response.Response(
             {"message": f"Recording stopped for room {room.slug}."}
@@ -449,6 +603,9 @@ class RoomViewSet(
         methods=["POST"],
         url_path="webhooks-livekit",
         permission_classes=[],
+        # The LiveKit SDK verifies and parses the raw body itself, so don't
+        # let DRF parse the payload a second time
+        parser_classes=[],
     )
     def webhooks_livekit(self, request):
         """Process webhooks from LiveKit."""
@@ -457,8 +614,13 @@ class RoomViewSet(
 
         try:
             livekit_events_service.receive(request)
-            return drf_response.Response(
-                {"status": "success"}, status=drf_status.HTTP_200_OK
+            # Plain HttpResponse with a precomputed body: this endpoint is hit
+            # for every LiveKit event and doesn't need the DRF renderer and
+            # content-negotiation machinery on its success path. JsonResponse
+            # would re-serialize the constant body on every call.
+            # pylint: disable-next=http-response-with-content-type-json
+            return HttpResponse(
+                LIVEKIT_WEBHOOK_OK_BODY, content_type="application/json"
             )
         except LiveKitWebhookError as e:
             status_code = getattr(e, "status_code", drf_status.HTTP_400_BAD_REQUEST)
@@ -513,13 +675,15 @@ class ResourceAccessListModelMixin:
         queryset = super().get_queryset()
         if self.action == "list":
             user = self.request.user
-            queryset = queryset.filter(
-                Q(resource__accesses__user=user),
-                resource__accesses__role__in=[
+            user_accesses = models.ResourceAccess.objects.filter(
+                resource=OuterRef("resource_id"),
+                user=user,
+                role__in=[
                     models.RoleChoices.ADMIN,
                     models.RoleChoices.OWNER,
                 ],
-            ).distinct()
+            )
+            queryset = queryset.filter(Exists(user_accesses))
         return queryset
 
 
@@ -550,19 +714,38 @@ class RecordingViewSet(
     API endpoints to access and perform actions on recordings.
     """
 
-    pagination_class = Pagination
+    pagination_class = RecordingCursorPagination
     permission_classes = [permissions.HasAbilityPermission]
     queryset = models.Recording.objects.all()
     serializer_class = serializers.RecordingSerializer
 
     def get_queryset(self):
-        """Restrict recordings to the user's ones."""
+        """Restrict recordings to the user's ones.
+
+        An EXISTS subquery on the accesses avoids the join + DISTINCT a filter
+        on the reverse relation would require.
+        """
         user = self.request.user
-        return (
-            super()
-            .get_queryset()
-            .filter(Q(accesses__user=user) | Q(accesses__team__in=user.get_teams()))
+        user_accesses = models.RecordingAccess.objects.filter_user(user).filter(
+            recording=OuterRef("pk")
         )
+        queryset = super().get_queryset().filter(Exists(user_accesses))
+
+        if self.action == "list":
+            # Fetch the related room in the same query and restrict both rows
+            # to the columns rendered by the serializer
+            queryset = queryset.select_related("room").only(
+                "id",
+                "created_at",
+                "updated_at",
+                "status",
+                "room__id",
+                "room__name",
+                "room__slug",
+                "room__access_level",
+            )
+
+        return queryset
 
     @decorators.action(
         detail=False,
@@ -601,18 +784,16 @@ class RecordingViewSet(
                 " in an error state or has already been saved."
             )
 
-        # Attempt to notify external services about the recording
-        # This is a non-blocking operation - failures are logged but don't interrupt the flow
-        notification_succeeded = notification_service.notify_external_services(
-            recording
-        )
+        # Mark the recording saved right away so a duplicate storage event
+        # cannot trigger a second notification, then notify external services
+        # off the request thread. On success, the task transitions the
+        # recording to NOTIFICATION_SUCCEEDED; failures are logged but don't
+        # interrupt the flow.
+        recording.status = models.RecordingStatusChoices.SAVED
+        # "updated_at" is an auto_now field: it is only refreshed when listed
+        recording.save(update_fields=["status", "updated_at"])
 
-        recording.status = (
-            models.RecordingStatusChoices.NOTIFICATION_SUCCEEDED
-            if notification_succeeded
-            else models.RecordingStatusChoices.SAVED
-        )
-        recording.save()
+        tasks.notify_recording_external_services.delay(str(recording.id))
 
         return drf_response.Response(
             {"message": "Event processed."},
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.8 on 2026-08-26 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_alter_room_access_level'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='recording',
+            index=models.Index(fields=['-created_at', '-id'], name='idx_recording_created_at_id'),
+        ),
+    ]
@@ -192,6 +192,9 @@ class User(AbstractBaseUser, BaseModel, auth_models.PermissionsMixin):
 
     objects = auth_models.UserManager()
 
+    # Per-instance memoization of `get_teams`
+    _cached_teams = None
+
     USERNAME_FIELD = "admin_email"
     REQUIRED_FIELDS = []
 
@@ -213,6 +216,18 @@ class User(AbstractBaseUser, BaseModel, auth_models.PermissionsMixin):
     def get_teams(self):
         """
         Get list of teams in which the user is, as a list of strings.
+
+        The result is memoized on the user instance because accesses may be
+        filtered several times while processing a single request (queryset
+        building, permission checks...).
+        """
+        if self._cached_teams is None:
+            self._cached_teams = self._get_teams()
+        return self._cached_teams
+
+    def _get_teams(self):
+        """
+        Retrieve the list of teams in which the user is, as a list of strings.
         Must be cached if retrieved remotely.
         """
         return []
@@ -274,8 +289,17 @@ class Resource(BaseModel):
         if not user or not user.is_authenticated:
             return None
 
+        if "accesses" in getattr(self, "_prefetched_objects_cache", {}):
+            # Filter in Python to reuse the prefetched accesses instead of
+            # triggering a new query per resource
+            accesses = [
+                access for access in self.accesses.all() if access.user_id == user.id
+            ]
+        else:
+            accesses = self.accesses.filter(user=user)
+
         role = None
-        for access in self.accesses.filter(user=user):
+        for access in accesses:
             if access.role == RoleChoices.OWNER:
                 return RoleChoices.OWNER
             if access.role == RoleChoices.ADMIN:
@@ -533,6 +557,14 @@ class Recording(BaseModel):
         ordering = ("-created_at",)
         verbose_name = _("Recording")
         verbose_name_plural = _("Recordings")
+        indexes = [
+            # Backs the cursor pagination of the recordings list, which orders
+            # by creation date with the id as tie-breaker
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="idx_recording_created_at_id",
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["room"],
@@ -0,0 +1,34 @@
+"""Celery tasks for the Meet core application."""
+
+from logging import getLogger
+
+from django.utils import timezone
+
+from celery import shared_task
+
+from core import models
+from core.recording.event.notification import notification_service
+
+logger = getLogger(__name__)
+
+
+@shared_task
+def notify_recording_external_services(recording_id):
+    """Notify external services that a recording is ready.
+
+    Runs off the request thread so the storage hook endpoint does not block on
+    external I/O. On success, the recording transitions from SAVED to
+    NOTIFICATION_SUCCEEDED; on failure it stays SAVED.
+    """
+    try:
+        recording = models.Recording.objects.get(id=recording_id)
+    except models.Recording.DoesNotExist:
+        logger.error("No recording found with id %s", recording_id)
+        return
+
+    if notification_service.notify_external_services(recording):
+        # update() bypasses auto_now, so refresh "updated_at" explicitly
+        models.Recording.objects.filter(pk=recording.pk).update(
+            status=models.RecordingStatusChoices.NOTIFICATION_SUCCEEDED,
+            updated_at=timezone.now(),
+        )
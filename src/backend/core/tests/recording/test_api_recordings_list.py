@@ -6,7 +6,7 @@ import operator
 from unittest import mock
 
 import pytest
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination
 from rest_framework.test import APIClient
 
 from core import factories
@@ -103,9 +103,9 @@ def test_api_recording_list_authenticated_via_team(mock_user_get_teams):
     assert expected_ids == results_id
 
 
-@mock.patch.object(PageNumberPagination, "get_page_size", return_value=2)
+@mock.patch.object(CursorPagination, "get_page_size", return_value=2)
 def test_api_recordings_list_pagination(_mock_page_size):
-    """Pagination should work as expected."""
+    """Cursor pagination should work as expected."""
     user = factories.UserFactory()
     client = APIClient()
     client.force_login(user)
@@ -119,25 +119,22 @@ def test_api_recordings_list_pagination(_mock_page_size):
 
     assert response.status_code == 200
     content = response.json()
-    assert content["count"] == 3
-    assert content["next"] == "http://testserver/api/v1.0/recordings/?page=2"
+    assert "count" not in content
+    assert content["next"].startswith("http://testserver/api/v1.0/recordings/?cursor=")
     assert content["previous"] is None
 
     assert len(content["results"]) == 2
     for item in content["results"]:
         recording_ids.remove(item["id"])
 
-    # Get page 2
-    response = client.get(
-        "/api/v1.0/recordings/?page=2",
-    )
+    # Get page 2 by following the cursor
+    response = client.get(content["next"])
 
     assert response.status_code == 200
     content = response.json()
 
-    assert content["count"] == 3
     assert content["next"] is None
-    assert content["previous"], "http://testserver/api/v1.0/recordings/"
+    assert content["previous"] is not None
 
     assert len(content["results"]) == 1
     recording_ids.remove(content["results"][0]["id"])
@@ -178,3 +175,62 @@ def test_api_recordings_list_ordering_default():
     # Check that results are sorted by descending "updated_at" as expected
     for i in range(4):
         assert operator.ge(results[i]["updated_at"], results[i + 1]["updated_at"])
+
+
+@mock.patch.object(CursorPagination, "get_page_size", return_value=2)
+def test_api_recordings_list_pagination_no_count_query(
+    _mock_page_size, django_assert_num_queries
+):
+    """Cursor pagination should never issue a COUNT query, whatever the page."""
+    user = factories.UserFactory()
+    client = APIClient()
+    client.force_login(user)
+
+    factories.UserRecordingAccessFactory.create_batch(3, user=user)
+
+    with django_assert_num_queries(2):
+        response = client.get("/api/v1.0/recordings/")
+
+    assert response.status_code == 200
+    content = response.json()
+    assert len(content["results"]) == 2
+
+    with django_assert_num_queries(2):
+        response = client.get(content["next"])
+
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == 1
+
+
+def test_api_recordings_list_authenticated_via_team_and_direct(mock_user_get_teams):
+    """A recording accessible both directly and via a team should only be listed once."""
+    user = factories.UserFactory()
+    client = APIClient()
+    client.force_login(user)
+
+    mock_user_get_teams.return_value = ["team1"]
+
+    access = factories.UserRecordingAccessFactory(user=user)
+    factories.TeamRecordingAccessFactory(team="team1", recording=access.recording)
+
+    response = client.get("/api/v1.0/recordings/")
+
+    assert response.status_code == 200
+    content = response.json()
+    assert len(content["results"]) == 1
+    assert content["results"][0]["id"] == str(access.recording_id)
+
+
+def test_api_recordings_list_number_of_queries(django_assert_num_queries):
+    """The number of queries should not grow with the number of recordings listed."""
+    user = factories.UserFactory()
+    client = APIClient()
+    client.force_login(user)
+
+    factories.UserRecordingAccessFactory.create_batch(3, user=user)
+
+    with django_assert_num_queries(2):
+        response = client.get("/api/v1.0/recordings/")
+
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == 3
@@ -103,6 +103,26 @@ def test_api_rooms_list_pagination(_mock_page_size):
     assert room_ids == []
 
 
+@mock.patch.object(PageNumberPagination, "get_page_size", return_value=2)
+def test_api_rooms_list_pagination_number_of_queries(
+    _mock_page_size, django_assert_num_queries
+):
+    """An overflowing first page should reuse the probed rows, adding only a COUNT."""
+    user = UserFactory()
+    client = APIClient()
+    client.force_login(user)
+
+    RoomFactory.create_batch(3, users=[user])
+
+    with django_assert_num_queries(4):
+        response = client.get("/api/v1.0/rooms/")
+
+    assert response.status_code == 200
+    content = response.json()
+    assert content["count"] == 3
+    assert len(content["results"]) == 2
+
+
 def test_api_rooms_list_authenticated_distinct():
     """A public room with several related users should only be listed once."""
     user = UserFactory()
@@ -120,3 +140,21 @@ def test_api_rooms_list_authenticated_distinct():
     content = response.json()
     assert len(content["results"]) == 1
     assert content["results"][0]["id"] == str(room.id)
+
+
+def test_api_rooms_list_number_of_queries(django_assert_num_queries):
+    """The number of queries should not grow with the number of rooms listed."""
+    user = UserFactory()
+    other_user = UserFactory()
+    client = APIClient()
+    client.force_login(user)
+
+    RoomFactory.create_batch(3, users=[user, other_user])
+
+    with django_assert_num_queries(3):
+        response = client.get(
+            "/api/v1.0/rooms/",
+        )
+
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == 3
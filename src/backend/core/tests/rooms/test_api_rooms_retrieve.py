@@ -484,3 +484,60 @@ def test_api_rooms_retrieve_administrators(mock_token, django_assert_num_queries
     mock_token.assert_called_once_with(
         room=expected_name, user=user, username=None, color=None
     )
+
+
+@override_settings(ALLOW_UNREGISTERED_ROOMS=True)
+@override_settings(
+    LIVEKIT_CONFIGURATION={
+        "api_key": "key",
+        "api_secret": "secret",
+        "url": "test_url_value",
+    }
+)
+@mock.patch("core.utils.generate_token", return_value="foo")
+def test_api_rooms_retrieve_authenticated_unregistered_cached_token(mock_token):
+    """
+    Repeated retrievals of the same unregistered room by the same authenticated
+    user should reuse the cached token instead of signing a new one for each
+    request.
+    """
+    user = UserFactory()
+    client = APIClient()
+    client.force_login(user)
+
+    for _ in range(2):
+        response = client.get("/api/v1.0/rooms/unregistered-room-cached/")
+        assert response.status_code == 200
+        assert response.json()["livekit"]["token"] == "foo"
+
+    mock_token.assert_called_once_with(
+        room="unregistered-room-cached", user=user, username=None
+    )
+
+
+@override_settings(ALLOW_UNREGISTERED_ROOMS=True)
+@override_settings(
+    LIVEKIT_CONFIGURATION={
+        "api_key": "key",
+        "api_secret": "secret",
+        "url": "test_url_value",
+    }
+)
+@mock.patch("core.utils.generate_token", return_value="foo")
+def test_api_rooms_retrieve_anonymous_unregistered_token_not_cached(mock_token):
+    """
+    Tokens must never be cached for anonymous users: each of them is given a
+    unique LiveKit identity, so sharing a token would make two visitors of the
+    same room collide.
+    """
+    client = APIClient()
+
+    for _ in range(2):
+        response = client.get("/api/v1.0/rooms/unregistered-room-cached/")
+        assert response.status_code == 200
+        assert response.json()["livekit"]["token"] == "foo"
+
+    assert mock_token.call_count == 2
+    mock_token.assert_called_with(
+        room="unregistered-room-cached", user=AnonymousUser(), username=None
+    )
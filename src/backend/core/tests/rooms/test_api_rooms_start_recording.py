@@ -9,6 +9,7 @@ from unittest import mock
 import pytest
 from rest_framework.test import APIClient
 
+from ...api import viewsets
 from ...factories import RoomFactory, UserFactory
 from ...models import Recording
 from ...recording.worker.exceptions import RecordingStartError
@@ -35,10 +36,14 @@ def mock_worker_service_factory(mock_worker_service):
 @pytest.fixture
 def mock_worker_manager(mock_worker_service):
     """Mock worker service mediator."""
+    # Mediators are cached per recording mode, reset the cache so the
+    # mocked classes are used to build them
+    viewsets.get_worker_service_mediator.cache_clear()
     with mock.patch("core.api.viewsets.WorkerServiceMediator") as mock_mediator_class:
         mock_mediator = mock.Mock()
         mock_mediator_class.return_value = mock_mediator
         yield mock_mediator
+    viewsets.get_worker_service_mediator.cache_clear()
 
 
 def test_start_recording_anonymous():
@@ -956,3 +956,23 @@ def test_api_room_user_access_delete_owners_last_owner():
 
     assert response.status_code == 403
     assert ResourceAccess.objects.count() == 1
+
+
+def test_api_room_user_accesses_list_number_of_queries(django_assert_num_queries):
+    """The number of queries should not grow with the number of accesses listed."""
+    user = UserFactory()
+
+    client = APIClient()
+    client.force_login(user)
+
+    for room in RoomFactory.create_batch(3):
+        UserResourceAccessFactory(resource=room, user=user, role="administrator")
+        UserResourceAccessFactory(resource=room, role="member")
+
+    with django_assert_num_queries(3):
+        response = client.get(
+            "/api/v1.0/resource-accesses/",
+        )
+
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == 6
@@ -44,3 +44,16 @@ def test_models_users_send_mail_main_missing():
         user.email_user("my subject", "my message")
 
     assert str(excinfo.value) == "User has no email address."
+
+
+def test_models_users_get_teams_memoized():
+    """The "get_teams" method should only fetch teams once per user instance."""
+    user = factories.UserFactory()
+
+    with mock.patch.object(
+        type(user), "_get_teams", return_value=["team1"]
+    ) as mock_get_teams:
+        assert user.get_teams() == ["team1"]
+        assert user.get_teams() == ["team1"]
+
+    mock_get_teams.assert_called_once()
@@ -0,0 +1,53 @@
+"""
+Unit tests for the core application Celery tasks
+"""
+
+import uuid
+from unittest import mock
+
+import pytest
+
+from core import tasks
+from core.factories import RecordingFactory
+from core.models import RecordingStatusChoices
+
+pytestmark = pytest.mark.django_db
+
+
+def test_tasks_notify_recording_external_services_success():
+    """On success, the recording should transition to "notification_succeeded"."""
+    recording = RecordingFactory(status=RecordingStatusChoices.SAVED)
+    updated_at = recording.updated_at
+
+    with mock.patch(
+        "core.tasks.notification_service.notify_external_services", return_value=True
+    ) as mock_notify:
+        tasks.notify_recording_external_services(str(recording.id))
+
+    mock_notify.assert_called_once()
+    recording.refresh_from_db()
+    assert recording.status == RecordingStatusChoices.NOTIFICATION_SUCCEEDED
+    assert recording.updated_at > updated_at
+
+
+def test_tasks_notify_recording_external_services_failure():
+    """On failure, the recording should stay "saved"."""
+    recording = RecordingFactory(status=RecordingStatusChoices.SAVED)
+
+    with mock.patch(
+        "core.tasks.notification_service.notify_external_services", return_value=False
+    ):
+        tasks.notify_recording_external_services(str(recording.id))
+
+    recording.refresh_from_db()
+    assert recording.status == RecordingStatusChoices.SAVED
+
+
+def test_tasks_notify_recording_external_services_unknown_recording():
+    """An unknown recording id should be logged and not raise."""
+    with mock.patch(
+        "core.tasks.notification_service.notify_external_services"
+    ) as mock_notify:
+        tasks.notify_recording_external_services(str(uuid.uuid4()))
+
+    mock_notify.assert_not_called()
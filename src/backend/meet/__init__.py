@@ -0,0 +1,7 @@
+"""Meet project package."""
+
+# Make sure the Celery app is loaded when Django starts so that shared tasks
+# are bound to it (see https://docs.celeryq.dev/en/stable/django/).
+from .celery_app import app as celery_app
+
+__all__ = ("celery_app",)